@@ -1,9 +1,11 @@
 """The Puzzle Game integration."""
 from __future__ import annotations
 
+import inspect
 import logging
 import os
 import shutil
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +32,8 @@ from .const import (
     SERVICE_CANCEL_SPELLING,
     SERVICE_GIVE_UP,
     SERVICE_SET_SESSION,
+    SERVICE_LISTENING_TIMEOUT,
+    SERVICE_RESET_TIMEOUT,
 )
 from .storage import PuzzleGameStorage
 from .coordinator import PuzzleGameCoordinator
@@ -38,10 +42,27 @@ _LOGGER = logging.getLogger(__name__)
 
 # Panel version - increment when frontend changes
 PANEL_VERSION = "1.0.8"
+PANEL_JS_URL = f"/puzzle_game/panel-{PANEL_VERSION}.js"
 PANEL_URL = "puzzle-game"
 PANEL_TITLE = "Puzzle Game"
 PANEL_ICON = "mdi:owl"
 
+# hass.data keys marking that the panel and its static path were registered.
+# They are kept outside hass.data[DOMAIN] because both outlive entry reloads.
+_PANEL_REGISTERED_KEY = f"{DOMAIN}_panel_registered"
+_STATIC_PATH_REGISTERED_KEY = f"{DOMAIN}_static_path_registered"
+
+# Frontend panel script shipped with the integration
+_PANEL_JS_PATH = Path(__file__).parent / "frontend" / "panel.js"
+
+_STATIC_PATHS = [
+    StaticPathConfig(
+        PANEL_JS_URL,
+        str(_PANEL_JS_PATH),
+        True,  # URL is versioned, so browsers may cache it
+    )
+]
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 # Service schemas
@@ -77,13 +98,42 @@ SERVICE_FINISH_SPELLING_SCHEMA = vol.Schema(
     }
 )
 
+# Each service passes its call data straight to a coordinator method:
+# (service, coordinator method, call data keys, schema)
+_COORDINATOR_SERVICES = (
+    (SERVICE_START_GAME, "start_game", ("bonus",), SERVICE_START_GAME_SCHEMA),
+    (SERVICE_SUBMIT_ANSWER, "submit_answer", ("answer",), SERVICE_SUBMIT_ANSWER_SCHEMA),
+    (SERVICE_REVEAL_LETTER, "reveal_letter", (), None),
+    (SERVICE_SKIP_WORD, "skip_word", (), None),
+    (SERVICE_REPEAT_CLUE, "repeat_clue", (), None),
+    (SERVICE_START_SPELLING, "start_spelling_mode", (), None),
+    (SERVICE_ADD_LETTER, "add_spelling_letter", ("letter",), SERVICE_ADD_LETTER_SCHEMA),
+    (SERVICE_FINISH_SPELLING, "finish_spelling", ("text",), SERVICE_FINISH_SPELLING_SCHEMA),
+    (SERVICE_CANCEL_SPELLING, "cancel_spelling", (), None),
+    (SERVICE_GIVE_UP, "give_up", (), None),
+    (SERVICE_LISTENING_TIMEOUT, "handle_listening_timeout", (), None),
+    (SERVICE_RESET_TIMEOUT, "reset_timeout_retries", (), None),
+    (
+        SERVICE_SET_SESSION,
+        "set_session_active",
+        ("active", "satellite", "view_assist_device"),
+        SERVICE_SET_SESSION_SCHEMA,
+    ),
+)
+
+# Every service registered by _async_setup_services
+_SERVICES = tuple(service for service, *_ in _COORDINATOR_SERVICES)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Puzzle Game from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Register the panel (sidebar entry) and serve frontend files
-    await _async_register_panel(hass)
+    # Register the panel (sidebar entry) and serve frontend files without
+    # holding up entry setup
+    hass.async_create_background_task(
+        _async_register_panel(hass), f"{DOMAIN} panel registration"
+    )
 
     # Initialize storage
     storage = PuzzleGameStorage(hass)
@@ -109,52 +159,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register services
     await _async_setup_services(hass, coordinator)
 
-    # Clean up old games
-    await storage.cleanup_old_games()
+    # Clean up old games and files left by previous versions without
+    # holding up setup
+    entry.async_create_background_task(
+        hass, _async_cleanup(hass, storage), f"{DOMAIN} cleanup"
+    )
 
     return True
 
 
 async def _async_register_panel(hass: HomeAssistant) -> None:
-    """Register the Puzzle Game panel in the sidebar."""
-    _LOGGER.info("Starting panel registration for Puzzle Game")
+    """Register the Puzzle Game panel in the sidebar.
 
-    # Path to frontend files
-    frontend_path = Path(__file__).parent / "frontend"
-    panel_js_path = frontend_path / "panel.js"
+    Only the first config entry to set up registers it. The flag is
+    cleared again on failure so a later setup or reload can retry.
+    """
+    if hass.data.get(_PANEL_REGISTERED_KEY):
+        return
+    hass.data[_PANEL_REGISTERED_KEY] = True
 
-    _LOGGER.info("Looking for panel.js at: %s", panel_js_path)
+    _LOGGER.debug("Registering Puzzle Game panel v%s from %s", PANEL_VERSION, _PANEL_JS_PATH)
 
-    if not panel_js_path.exists():
-        _LOGGER.error("Panel JS file not found at %s", panel_js_path)
+    # Checking the file is blocking I/O, so keep it off the event loop
+    if not await hass.async_add_executor_job(_PANEL_JS_PATH.is_file):
+        _LOGGER.error("Panel JS file not found at %s", _PANEL_JS_PATH)
+        hass.data.pop(_PANEL_REGISTERED_KEY, None)
         return
 
-    _LOGGER.info("Panel JS file found, registering static path")
-
-    # Register static path for the panel JS file
-    try:
-        await hass.http.async_register_static_paths(
-            [
-                StaticPathConfig(
-                    f"/puzzle_game/panel-{PANEL_VERSION}.js",
-                    str(panel_js_path),
-                    False,  # Disable cache for development
-                )
-            ]
-        )
-        _LOGGER.info("Static path registered: /puzzle_game/panel-%s.js", PANEL_VERSION)
-    except RuntimeError as err:
-        # Static path may already be registered from a previous load
-        if "already registered" in str(err).lower():
-            _LOGGER.info("Static path already registered, continuing")
-        else:
+    # Register static path for the panel JS file, unless an earlier attempt
+    # got that far before the panel itself failed to register
+    if not hass.data.get(_STATIC_PATH_REGISTERED_KEY):
+        try:
+            await hass.http.async_register_static_paths(_STATIC_PATHS)
+        except Exception as err:
             _LOGGER.error("Failed to register static path: %s", err)
+            hass.data.pop(_PANEL_REGISTERED_KEY, None)
             return
-    except Exception as err:
-        _LOGGER.error("Failed to register static path: %s", err)
-        return
-
-    _LOGGER.info("Registering panel with panel_custom.async_register_panel")
+        hass.data[_STATIC_PATH_REGISTERED_KEY] = True
 
     # Register the panel using panel_custom
     try:
@@ -164,37 +205,54 @@ async def _async_register_panel(hass: HomeAssistant) -> None:
             webcomponent_name="puzzle-game-panel",
             sidebar_title=PANEL_TITLE,
             sidebar_icon=PANEL_ICON,
-            module_url=f"/puzzle_game/panel-{PANEL_VERSION}.js",
+            module_url=PANEL_JS_URL,
             embed_iframe=False,
             trust_external=False,
             require_admin=False,
         )
-        _LOGGER.info("Puzzle Game panel successfully registered at /%s", PANEL_URL)
+        _LOGGER.info("Puzzle Game panel registered at /%s", PANEL_URL)
     except Exception as err:
         _LOGGER.error("Failed to register panel: %s (type: %s)", err, type(err).__name__)
+        hass.data.pop(_PANEL_REGISTERED_KEY, None)
+
+
+async def _async_cleanup(hass: HomeAssistant, storage: PuzzleGameStorage) -> None:
+    """Remove finished games past retention and old www files."""
+    await storage.cleanup_old_games()
+    await _async_cleanup_old_files(hass, storage)
+
 
-    # Clean up old www files from previous versions
-    await _async_cleanup_old_files(hass)
+async def _async_cleanup_old_files(hass: HomeAssistant, storage: PuzzleGameStorage) -> None:
+    """Remove old www files from previous versions.
 
+    Once the directory is known to be gone this is recorded in storage,
+    so later setups skip the check entirely.
+    """
+    if storage.legacy_files_cleaned:
+        return
 
-async def _async_cleanup_old_files(hass: HomeAssistant) -> None:
-    """Remove old www files from previous versions."""
     # Old destination from previous versions
     old_www_dir = Path(hass.config.path("www")) / "community" / "puzzle_game"
 
-    def cleanup():
-        """Remove old files (runs in executor)."""
+    def cleanup() -> bool:
+        """Remove old files (runs in executor). Return True if none remain."""
         if old_www_dir.exists():
             try:
                 shutil.rmtree(old_www_dir)
                 _LOGGER.info("Removed old www files from %s", old_www_dir)
             except Exception as err:
                 _LOGGER.debug("Could not remove old www files: %s", err)
+                return False
+        return True
 
     try:
-        await hass.async_add_executor_job(cleanup)
+        cleaned = await hass.async_add_executor_job(cleanup)
     except Exception as err:
         _LOGGER.debug("Cleanup failed: %s", err)
+        return
+
+    if cleaned:
+        storage.async_set_legacy_files_cleaned()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -204,229 +262,39 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove services if no more entries
     if not hass.data[DOMAIN]:
-        for service in [
-            SERVICE_START_GAME,
-            SERVICE_SUBMIT_ANSWER,
-            SERVICE_REVEAL_LETTER,
-            SERVICE_SKIP_WORD,
-            SERVICE_REPEAT_CLUE,
-            SERVICE_GIVE_UP,
-            SERVICE_SET_SESSION,
-        ]:
+        for service in _SERVICES:
             hass.services.async_remove(DOMAIN, service)
 
     return unload_ok
 
 
-async def _async_setup_services(hass: HomeAssistant, coordinator: PuzzleGameCoordinator) -> None:
-    """Set up services for Puzzle Game."""
+async def _async_call_coordinator(
+    coordinator: PuzzleGameCoordinator,
+    method_name: str,
+    data_keys: tuple[str, ...],
+    call: ServiceCall,
+) -> ServiceResponse:
+    """Pass call data to a coordinator method and return its response.
 
-    async def handle_start_game(call: ServiceCall) -> ServiceResponse:
-        """Handle start game service."""
-        bonus = call.data.get("bonus", False)
-        result = await coordinator.start_game(bonus=bonus)
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_submit_answer(call: ServiceCall) -> ServiceResponse:
-        """Handle submit answer service."""
-        answer = call.data.get("answer", "")
-        result = await coordinator.submit_answer(answer)
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_reveal_letter(call: ServiceCall) -> ServiceResponse:
-        """Handle reveal letter service."""
-        result = await coordinator.reveal_letter()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_skip_word(call: ServiceCall) -> ServiceResponse:
-        """Handle skip word service."""
-        result = await coordinator.skip_word()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_repeat_clue(call: ServiceCall) -> ServiceResponse:
-        """Handle repeat clue service."""
-        result = await coordinator.repeat_clue()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_start_spelling(call: ServiceCall) -> ServiceResponse:
-        """Handle start spelling mode service."""
-        result = await coordinator.start_spelling_mode()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_add_letter(call: ServiceCall) -> ServiceResponse:
-        """Handle add letter service."""
-        letter = call.data.get("letter", "")
-        result = await coordinator.add_spelling_letter(letter)
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_finish_spelling(call: ServiceCall) -> ServiceResponse:
-        """Handle finish spelling service."""
-        text = call.data.get("text")
-        result = await coordinator.finish_spelling(text=text)
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_cancel_spelling(call: ServiceCall) -> ServiceResponse:
-        """Handle cancel spelling service."""
-        result = await coordinator.cancel_spelling()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_give_up(call: ServiceCall) -> ServiceResponse:
-        """Handle give up service."""
-        result = await coordinator.give_up()
-        return {
-            "success": result["success"],
-            "message": result["message"],
-        }
-
-    async def handle_set_session(call: ServiceCall) -> ServiceResponse:
-        """Handle set session service."""
-        active = call.data.get("active", False)
-        satellite = call.data.get("satellite")
-        view_assist_device = call.data.get("view_assist_device")
-        coordinator.set_session_active(active, satellite, view_assist_device)
-        return {
-            "success": True,
-            "session_active": active,
-            "active_satellite": satellite,
-            "view_assist_device": view_assist_device,
-        }
-
-    async def handle_listening_timeout(call: ServiceCall) -> ServiceResponse:
-        """Handle listening timeout service."""
-        result = await coordinator.handle_listening_timeout()
-        return {
-            "success": result["success"],
-            "should_retry": result["should_retry"],
-            "should_pause": result["should_pause"],
-            "message": result["message"],
-            "retry_count": result["retry_count"],
-        }
-
-    async def handle_reset_timeout(call: ServiceCall) -> ServiceResponse:
-        """Handle reset timeout retries service."""
-        await coordinator.reset_timeout_retries()
-        return {"success": True}
+    Bound per service with functools.partial in _async_setup_services.
+    Methods that do no I/O, such as set_session_active, are plain
+    functions and are not awaited.
+    """
+    method = getattr(coordinator, method_name)
+    result = method(**{key: call.data[key] for key in data_keys if key in call.data})
+    if inspect.isawaitable(result):
+        result = await result
+    return result
 
-    # Register services with response support
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_START_GAME,
-        handle_start_game,
-        schema=SERVICE_START_GAME_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SUBMIT_ANSWER,
-        handle_submit_answer,
-        schema=SERVICE_SUBMIT_ANSWER_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REVEAL_LETTER,
-        handle_reveal_letter,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SKIP_WORD,
-        handle_skip_word,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REPEAT_CLUE,
-        handle_repeat_clue,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_START_SPELLING,
-        handle_start_spelling,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_LETTER,
-        handle_add_letter,
-        schema=SERVICE_ADD_LETTER_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_FINISH_SPELLING,
-        handle_finish_spelling,
-        schema=SERVICE_FINISH_SPELLING_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CANCEL_SPELLING,
-        handle_cancel_spelling,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GIVE_UP,
-        handle_give_up,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_SESSION,
-        handle_set_session,
-        schema=SERVICE_SET_SESSION_SCHEMA,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "listening_timeout",
-        handle_listening_timeout,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        "reset_timeout",
-        handle_reset_timeout,
-        supports_response=SupportsResponse.OPTIONAL,
-    )
+async def _async_setup_services(hass: HomeAssistant, coordinator: PuzzleGameCoordinator) -> None:
+    """Set up services for Puzzle Game."""
+    # Register services with response support
+    for service, method_name, data_keys, schema in _COORDINATOR_SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(_async_call_coordinator, coordinator, method_name, data_keys),
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
@@ -4,57 +4,34 @@ from __future__ import annotations
 import logging
 import random
 import re
-from datetime import datetime
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.components.conversation import async_converse
 
-from .const import FALLBACK_PUZZLES
+from .const import FALLBACK_PUZZLES, WORDS_PER_PUZZLE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Patterns used when parsing the AI response
+_MARKDOWN_RE = re.compile(r'\*+')
+_THEME_RE = re.compile(r'THEME[:\s\-]+([A-Z][A-Z\s]+)')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+# "WORD1: HORSES | Animals you ride", or with "-" instead of "|"
+_WORD_LINE_RE = re.compile(
+    r'WORD[^:]*:\s*(?:([^|]*?)\s*\|\s*(.*)|([^-]*?)\s*-\s*(.*))',
+    re.IGNORECASE,
+)
 
-def get_puzzle_prompt() -> tuple[str, int]:
-    """Generate the puzzle prompt based on day of week.
 
-    Returns:
-        Tuple of (prompt string, difficulty level)
-    """
-    day_of_week = datetime.now().weekday()
+# Weekdays with a fixed puzzle style (Monday is 0)
+_THURSDAY = 3
+_SUNDAY = 6
 
-    # Thursday = 3, Sunday = 6
-    if day_of_week == 3:  # Thursday - Movie theme
-        theme_instruction = """THURSDAY SPECIAL - MOVIE THEME:
-Your theme MUST be a famous movie, film franchise, or movie-related concept.
-Examples: STAR WARS, JAWS, TITANIC, MARVEL, PIXAR, HOLLYWOOD, CINEMA, etc.
-Difficulty: Medium (5/10) - Make it recognizable but not too obvious."""
-        difficulty = 5
-    elif day_of_week == 6:  # Sunday - Hardest
-        theme_instruction = """SUNDAY CHALLENGE - HARDEST PUZZLE:
-Choose an obscure or complex theme. Make it challenging!
-Difficulty: 10/10 - Use uncommon themes and tricky clues."""
-        difficulty = 10
-    else:  # Other days - Random difficulty
-        difficulty = random.randint(1, 9)
-        if difficulty <= 3:
-            theme_instruction = f"""EASY PUZZLE (Difficulty {difficulty}/10):
-Choose a common, everyday theme that most people would know.
-Use simple, straightforward clues."""
-        elif difficulty <= 6:
-            theme_instruction = f"""MEDIUM PUZZLE (Difficulty {difficulty}/10):
-Choose a moderately familiar theme.
-Make clues clear but not too obvious."""
-        else:
-            theme_instruction = f"""HARD PUZZLE (Difficulty {difficulty}/10):
-Choose a less common but still recognizable theme.
-Make clues more challenging and require some thought."""
-
-    prompt = f"""You are a creative puzzle generator. Generate a unique word puzzle.
+# Static parts of the puzzle prompt, joined around the day's theme instruction
+_PROMPT_HEADER = "You are a creative puzzle generator. Generate a unique word puzzle."
 
-{theme_instruction}
-
-Create a puzzle with these components:
+_PROMPT_BODY = """Create a puzzle with these components:
 
 1. A THEME (final answer): Choose any interesting noun or concept (4-15 letters, uppercase)
    - Can be single word: LIGHTHOUSE, TREEHOUSE, DETECTIVE, MICROSCOPE
@@ -79,9 +56,58 @@ WORD3: TORPEDO | Underwater explosive weapon
 WORD4: CAPTAIN | Person who commands the vessel
 WORD5: DEPTH | How far below the surface
 
+Reply with only these six lines. Do not add any text before or after them.
+
 Generate a creative puzzle now:"""
 
-    return prompt, difficulty
+_THURSDAY_INSTRUCTION = """THURSDAY SPECIAL - MOVIE THEME:
+Your theme MUST be a famous movie, film franchise, or movie-related concept.
+Examples: STAR WARS, JAWS, TITANIC, MARVEL, PIXAR, HOLLYWOOD, CINEMA, etc.
+Difficulty: Medium (5/10) - Make it recognizable but not too obvious."""
+
+_SUNDAY_INSTRUCTION = """SUNDAY CHALLENGE - HARDEST PUZZLE:
+Choose an obscure or complex theme. Make it challenging!
+Difficulty: 10/10 - Use uncommon themes and tricky clues."""
+
+_EASY_INSTRUCTION = """EASY PUZZLE (Difficulty {difficulty}/10):
+Choose a common, everyday theme that most people would know.
+Use simple, straightforward clues."""
+
+_MEDIUM_INSTRUCTION = """MEDIUM PUZZLE (Difficulty {difficulty}/10):
+Choose a moderately familiar theme.
+Make clues clear but not too obvious."""
+
+_HARD_INSTRUCTION = """HARD PUZZLE (Difficulty {difficulty}/10):
+Choose a less common but still recognizable theme.
+Make clues more challenging and require some thought."""
+
+# Weekday instruction template for each difficulty from 1 to 9
+_WEEKDAY_INSTRUCTIONS = (
+    (_EASY_INSTRUCTION,) * 3 + (_MEDIUM_INSTRUCTION,) * 3 + (_HARD_INSTRUCTION,) * 3
+)
+
+
+def get_puzzle_prompt(day_of_week: int) -> tuple[str, int]:
+    """Generate the puzzle prompt based on day of week.
+
+    Args:
+        day_of_week: Weekday of the puzzle date (Monday is 0)
+
+    Returns:
+        Tuple of (prompt string, difficulty level)
+    """
+    if day_of_week == _THURSDAY:  # Movie theme
+        template = _THURSDAY_INSTRUCTION
+        difficulty = 5
+    elif day_of_week == _SUNDAY:  # Hardest
+        template = _SUNDAY_INSTRUCTION
+        difficulty = 10
+    else:  # Other days - Random difficulty
+        difficulty = random.randint(1, 9)
+        template = _WEEKDAY_INSTRUCTIONS[difficulty - 1]
+
+    theme_instruction = template.format(difficulty=difficulty)
+    return "\n\n".join((_PROMPT_HEADER, theme_instruction, _PROMPT_BODY)), difficulty
 
 
 def parse_puzzle_response(text: str) -> dict | None:
@@ -94,59 +120,51 @@ def parse_puzzle_response(text: str) -> dict | None:
         Puzzle dict with theme, words, clues or None if parsing failed
     """
     try:
-        lines = text.strip().split("\n")
         theme = None
         words = []
         clues = []
 
-        for line in lines:
+        for line in text.splitlines():
             line = line.strip()
             if not line:
                 continue
 
             # Remove markdown formatting like **THEME:** or *THEME:*
-            clean_line = re.sub(r'\*+', '', line).strip()
+            clean_line = _MARKDOWN_RE.sub('', line).strip()
 
             # Try to extract theme with various formats
             if theme is None:
+                upper_line = clean_line.upper()
                 # Standard format: THEME: SOMETHING
-                if clean_line.upper().startswith("THEME:"):
-                    theme = clean_line.split(":", 1)[1].strip().upper()
+                if upper_line.startswith("THEME:"):
+                    theme = upper_line.split(":", 1)[1].strip()
                 # Alternative: "The theme is: SOMETHING" or "Theme is SOMETHING"
-                elif "THEME" in clean_line.upper() and ":" in clean_line:
-                    parts = clean_line.split(":", 1)
-                    if len(parts) > 1:
-                        theme = parts[1].strip().upper()
+                elif "THEME" in upper_line and ":" in upper_line:
+                    theme = upper_line.split(":", 1)[1].strip()
                 # Try regex for "THEME: WORD" or "THEME - WORD"
-                elif theme is None:
-                    theme_match = re.search(r'THEME[:\s\-]+([A-Z][A-Z\s]+)', clean_line.upper())
+                else:
+                    theme_match = _THEME_RE.search(upper_line)
                     if theme_match:
                         theme = theme_match.group(1).strip()
 
-            # Extract words - be more flexible with format
-            if clean_line.upper().startswith("WORD"):
-                # Format: WORD1: HORSES | Animals you ride at a fair
-                parts = clean_line.split(":", 1)
-                if len(parts) > 1:
-                    word_clue = parts[1].strip()
-                    if "|" in word_clue:
-                        word, clue = word_clue.split("|", 1)
-                        words.append(word.strip().upper())
-                        clues.append(clue.strip())
-                    elif "-" in word_clue and len(word_clue.split("-", 1)) == 2:
-                        # Alternative format: WORD1: HORSES - Animals you ride
-                        word, clue = word_clue.split("-", 1)
-                        words.append(word.strip().upper())
-                        clues.append(clue.strip())
+            # Extract words, split from their clue by "|" or else "-"
+            word_match = _WORD_LINE_RE.match(clean_line)
+            if word_match:
+                if word_match.group(1) is not None:
+                    word, clue = word_match.group(1, 2)
+                else:
+                    word, clue = word_match.group(3, 4)
+                words.append(word.upper())
+                clues.append(clue)
 
         # Clean up theme - remove any trailing punctuation or extra spaces
         if theme:
-            theme = re.sub(r'[^\w\s]', '', theme).strip()
+            theme = _PUNCTUATION_RE.sub('', theme).strip()
             # If theme has multiple words, keep them
             theme = ' '.join(theme.split())
 
         # Validate we got everything
-        if theme and len(words) == 5 and len(clues) == 5:
+        if theme and len(words) == WORDS_PER_PUZZLE and len(clues) == WORDS_PER_PUZZLE:
             return {
                 "theme": theme,
                 "words": words,
@@ -173,18 +191,20 @@ def get_fallback_puzzle() -> dict:
 
 async def generate_puzzle(
     hass: HomeAssistant,
+    day_of_week: int,
     conversation_agent: str | None = None
 ) -> dict:
     """Generate a puzzle using Home Assistant's conversation agent.
 
     Args:
         hass: Home Assistant instance
+        day_of_week: Weekday of the puzzle date (Monday is 0)
         conversation_agent: Optional specific agent to use
 
     Returns:
         Puzzle dict with theme, words, clues
     """
-    prompt, difficulty = get_puzzle_prompt()
+    prompt, difficulty = get_puzzle_prompt(day_of_week)
 
     try:
         # Use HA's conversation service
@@ -1,15 +1,22 @@
 """Constants for the Puzzle Game integration."""
+from typing import Final
 
 DOMAIN = "puzzle_game"
 
 # Game scoring
-POINTS_PER_WORD = 10
-FINAL_ANSWER_BONUS = 20
-MAX_SCORE = 70  # 5 words * 10 + 20 bonus
+WORDS_PER_PUZZLE: Final = 5
+POINTS_PER_WORD: Final = 10
+FINAL_ANSWER_BONUS: Final = 20
+MAX_SCORE: Final = WORDS_PER_PUZZLE * POINTS_PER_WORD + FINAL_ANSWER_BONUS
+
+# Clues that don't end with one of these get a period appended for TTS
+SENTENCE_ENDINGS = frozenset(".!?")
 
 # Storage keys
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 1
+# Seconds to wait before writing low-priority changes to disk
+STORAGE_SAVE_DELAY = 10
 
 # Sensor
 SENSOR_NAME = "Puzzle Game"
@@ -26,6 +33,8 @@ SERVICE_FINISH_SPELLING = "finish_spelling"
 SERVICE_CANCEL_SPELLING = "cancel_spelling"
 SERVICE_GIVE_UP = "give_up"
 SERVICE_SET_SESSION = "set_session"
+SERVICE_LISTENING_TIMEOUT = "listening_timeout"
+SERVICE_RESET_TIMEOUT = "reset_timeout"
 
 # Attributes
 ATTR_GAME_ID = "game_id"
@@ -50,7 +59,7 @@ ATTR_SPELLING_BUFFER = "spelling_buffer"
 CONF_CONVERSATION_AGENT = "conversation_agent"
 
 # Default fallback puzzles (used when AI fails)
-FALLBACK_PUZZLES = [
+FALLBACK_PUZZLES = (
     {
         "theme": "BASEBALL",
         "words": ["PITCHER", "STRIKE", "DIAMOND", "GLOVE", "HOMERUN"],
@@ -161,4 +170,4 @@ FALLBACK_PUZZLES = [
             "Inflated decorations that float"
         ]
     }
-]
+)
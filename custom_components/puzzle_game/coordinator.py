@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback, Event
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, CONF_CONVERSATION_AGENT
 from .storage import PuzzleGameStorage
@@ -56,8 +56,11 @@ class PuzzleGameCoordinator:
         """Return the active satellite entity."""
         return self._active_satellite
 
-    def set_session_active(self, active: bool, satellite: str | None = None, view_assist_device: str | None = None) -> None:
-        """Set the voice session active state and optionally the satellite."""
+    def set_session_active(self, active: bool, satellite: str | None = None, view_assist_device: str | None = None) -> dict[str, Any]:
+        """Set the voice session active state and optionally the satellite.
+
+        Returns the set_session service response.
+        """
         self._session_active = active
         if satellite is not None:
             self._active_satellite = satellite
@@ -73,15 +76,14 @@ class PuzzleGameCoordinator:
             self._active_satellite = None
             self._view_assist_device = None
         # Trigger a sensor update
-        game = self.storage.get_current_game()
-        if game:
-            state_data = self.game_manager.get_game_state_dict(game)
-        else:
-            state_data = self._get_empty_state()
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
-        self._update_sensor(state_data)
+        self._update_sensor(self._build_state_data(self.storage.get_current_game()))
+
+        return {
+            "success": True,
+            "session_active": active,
+            "active_satellite": satellite,
+            "view_assist_device": view_assist_device,
+        }
 
     def _start_stt_watch(self, stt_sensor: str) -> None:
         """Start watching the STT sensor for changes."""
@@ -123,6 +125,16 @@ class PuzzleGameCoordinator:
             self._stt_unsub = None
             _LOGGER.info("Stopped watching STT sensor")
 
+    def _build_state_data(self, game: dict | None) -> dict[str, Any]:
+        """Build sensor state for a game, including the voice session fields."""
+        if not game:
+            return self._get_empty_state()
+        state_data = self.game_manager.get_game_state_dict(game)
+        state_data["session_active"] = self._session_active
+        state_data["active_satellite"] = self._active_satellite
+        state_data["view_assist_device"] = self._view_assist_device
+        return state_data
+
     def _get_empty_state(self) -> dict[str, Any]:
         """Return empty game state."""
         return {
@@ -145,15 +157,7 @@ class PuzzleGameCoordinator:
 
     async def async_refresh_state(self) -> None:
         """Refresh state from storage and update sensor."""
-        game = self.storage.get_current_game()
-        if game:
-            state_data = self.game_manager.get_game_state_dict(game)
-        else:
-            state_data = self._get_empty_state()
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
-        self._update_sensor(state_data)
+        self._update_sensor(self._build_state_data(self.storage.get_current_game()))
 
     async def start_game(self, bonus: bool = False) -> dict[str, Any]:
         """Start a new game or continue existing one.
@@ -164,101 +168,89 @@ class PuzzleGameCoordinator:
         Returns:
             Dict with success status and message
         """
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        now = dt_util.utcnow()
+        today = now.date().isoformat()
 
         if bonus:
             # Check for existing active bonus game
             existing_bonus = self.storage.get_active_bonus_game()
             if existing_bonus:
                 # Resume existing bonus game
-                state_data = self.game_manager.get_game_state_dict(existing_bonus)
+                state_data = self._build_state_data(existing_bonus)
                 await self.storage.set_current_game(existing_bonus["id"])
                 self._update_sensor(state_data)
                 return {
                     "success": True,
-                    "message": f"Continuing your bonus game. {state_data['clue']}",
-                    "game_state": state_data
+                    "message": f"Continuing your bonus game. {state_data['clue']}"
                 }
 
             # Create new bonus puzzle
-            puzzle = await generate_puzzle(self.hass, self.conversation_agent)
-            bonus_date = f"bonus_{datetime.utcnow().isoformat()}"
-            await self.storage.save_puzzle(bonus_date, puzzle, is_daily=False)
+            puzzle = await generate_puzzle(
+                self.hass, now.weekday(), self.conversation_agent
+            )
+            bonus_date = f"bonus_{now.isoformat()}"
+            await self.storage.save_puzzle(bonus_date, puzzle, is_daily=False, save=False)
 
             # Create new bonus game
-            game = await self.storage.create_game(bonus_date, puzzle, is_bonus=True)
-
-            clues = puzzle.get("clues", [])
-            words = puzzle.get("words", [])
-            first_clue = clues[0] if clues else "Start playing"
-            first_word_desc = GameManager._word_description(words[0]) if words else ""
+            game = await self.storage.create_game(
+                bonus_date, puzzle, is_bonus=True, save=False
+            )
 
-            if not first_clue.endswith(('.', '!', '?')):
-                first_clue = f"{first_clue}."
-
-            message = f"Bonus round! First clue: {first_clue} {first_word_desc}."
+            first_clue = self.game_manager.format_word_clue(puzzle, 0, "Start playing")
+            message = f"Bonus round! First clue: {first_clue}."
             game["last_message"] = message
             await self.storage.update_game(game["id"], {"last_message": message})
 
-            state_data = self.game_manager.get_game_state_dict(game)
+            state_data = self._build_state_data(game)
             self._update_sensor(state_data)
 
             return {
                 "success": True,
-                "message": message,
-                "game_state": state_data
+                "message": message
             }
 
         # Daily puzzle flow
+        existing, completed = self.storage.get_daily_games(today)
+
         # Check if already completed today's puzzle
-        completed = self.storage.get_completed_daily_game(today)
         if completed:
             return {
                 "success": False,
-                "message": "You've already completed today's puzzle! Say 'play bonus game' for another round.",
-                "game_state": None
+                "message": "You've already completed today's puzzle! Say 'play bonus game' for another round."
             }
 
         # Check for existing active daily game
-        existing = self.storage.get_active_daily_game(today)
         if existing:
-            state_data = self.game_manager.get_game_state_dict(existing)
+            state_data = self._build_state_data(existing)
             await self.storage.set_current_game(existing["id"])
             self._update_sensor(state_data)
             return {
                 "success": True,
-                "message": f"Continuing today's puzzle. {state_data['clue']}",
-                "game_state": state_data
+                "message": f"Continuing today's puzzle. {state_data['clue']}"
             }
 
         # Get or create today's puzzle
         puzzle = self.storage.get_daily_puzzle(today)
         if not puzzle:
-            puzzle = await generate_puzzle(self.hass, self.conversation_agent)
-            await self.storage.save_puzzle(today, puzzle, is_daily=True)
+            puzzle = await generate_puzzle(
+                self.hass, now.weekday(), self.conversation_agent
+            )
+            await self.storage.save_puzzle(today, puzzle, is_daily=True, save=False)
 
         # Create new game
-        game = await self.storage.create_game(today, puzzle, is_bonus=False)
-
-        clues = puzzle.get("clues", [])
-        words = puzzle.get("words", [])
-        first_clue = clues[0] if clues else "Start playing"
-        first_word_desc = GameManager._word_description(words[0]) if words else ""
+        game = await self.storage.create_game(today, puzzle, is_bonus=False, save=False)
 
-        if not first_clue.endswith(('.', '!', '?')):
-            first_clue = f"{first_clue}."
-
-        message = f"New puzzle! First clue: {first_clue} {first_word_desc}."
+        first_clue = self.game_manager.format_word_clue(puzzle, 0, "Start playing")
+        message = f"New puzzle! First clue: {first_clue}."
         game["last_message"] = message
         await self.storage.update_game(game["id"], {"last_message": message})
 
-        state_data = self.game_manager.get_game_state_dict(game)
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": message,
-            "game_state": state_data
+            "message": message
         }
 
     async def submit_answer(self, answer: str) -> dict[str, Any]:
@@ -267,36 +259,27 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game. Say 'start puzzle game' to begin.",
-                "game_state": None
+                "message": "No active game. Say 'start puzzle game' to begin."
             }
 
         if not game.get("is_active"):
             return {
                 "success": False,
-                "message": "Game is not active. Start a new game.",
-                "game_state": None
+                "message": "Game is not active. Start a new game."
             }
 
         result = await self.game_manager.submit_answer(game, answer)
 
         # Update last message
-        game["last_message"] = result["message"]
-        await self.storage.update_game(game["id"], {"last_message": result["message"]})
+        game["last_message"] = result.message
+        await self.storage.update_game(game["id"], {"last_message": result.message})
 
-        # Refresh game from storage (it may have been updated)
-        game = self.storage.get_game(game["id"])
-        state_data = self.game_manager.get_game_state_dict(game)
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
-            "success": result["correct"],
-            "message": result["message"],
-            "game_state": state_data
+            "success": result.correct,
+            "message": result.message
         }
 
     async def reveal_letter(self) -> dict[str, Any]:
@@ -305,34 +288,26 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         if not game.get("is_active"):
             return {
                 "success": False,
-                "message": "Game is not active.",
-                "game_state": None
+                "message": "Game is not active."
             }
 
         result = await self.game_manager.reveal_letter(game)
 
-        game["last_message"] = result["message"]
-        await self.storage.update_game(game["id"], {"last_message": result["message"]})
+        game["last_message"] = result.message
+        await self.storage.update_game(game["id"], {"last_message": result.message})
 
-        game = self.storage.get_game(game["id"])
-        state_data = self.game_manager.get_game_state_dict(game)
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
-            "success": result["success"],
-            "message": result["message"],
-            "game_state": state_data
+            "success": result.success,
+            "message": result.message
         }
 
     async def skip_word(self) -> dict[str, Any]:
@@ -341,34 +316,26 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         if not game.get("is_active"):
             return {
                 "success": False,
-                "message": "Game is not active.",
-                "game_state": None
+                "message": "Game is not active."
             }
 
         result = await self.game_manager.skip_word(game)
 
-        game["last_message"] = result["message"]
-        await self.storage.update_game(game["id"], {"last_message": result["message"]})
+        game["last_message"] = result.message
+        await self.storage.update_game(game["id"], {"last_message": result.message})
 
-        game = self.storage.get_game(game["id"])
-        state_data = self.game_manager.get_game_state_dict(game)
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
-            "success": result["success"],
-            "message": result["message"],
-            "game_state": state_data
+            "success": result.success,
+            "message": result.message
         }
 
     async def repeat_clue(self) -> dict[str, Any]:
@@ -377,8 +344,7 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         clue = self.game_manager.get_current_clue(game)
@@ -386,17 +352,12 @@ class PuzzleGameCoordinator:
         game["last_message"] = clue
         await self.storage.update_game(game["id"], {"last_message": clue})
 
-        state_data = self.game_manager.get_game_state_dict(game)
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": clue,
-            "game_state": state_data
+            "message": clue
         }
 
     async def start_spelling_mode(self) -> dict[str, Any]:
@@ -405,8 +366,7 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         # Initialize spelling buffer
@@ -421,19 +381,14 @@ class PuzzleGameCoordinator:
             "last_message": message
         })
 
-        state_data = self.game_manager.get_game_state_dict(game)
+        state_data = self._build_state_data(game)
         state_data["spelling_mode"] = True
         state_data["spelling_buffer"] = []
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": message,
-            "game_state": state_data
+            "message": message
         }
 
     async def add_spelling_letter(self, letter: str) -> dict[str, Any]:
@@ -442,15 +397,13 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         if not game.get("spelling_mode"):
             return {
                 "success": False,
-                "message": "Not in spelling mode.",
-                "game_state": None
+                "message": "Not in spelling mode."
             }
 
         # Get current buffer
@@ -462,24 +415,21 @@ class PuzzleGameCoordinator:
         game["spelling_buffer"] = buffer
         game["last_message"] = message
 
+        # Letters are written out in one batch rather than one by one
         await self.storage.update_game(game["id"], {
             "spelling_buffer": buffer,
             "last_message": message
-        })
+        }, save=False)
+        self.storage.async_delay_save()
 
-        state_data = self.game_manager.get_game_state_dict(game)
+        state_data = self._build_state_data(game)
         state_data["spelling_mode"] = True
         state_data["spelling_buffer"] = buffer
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": message,
-            "game_state": state_data
+            "message": message
         }
 
     async def finish_spelling(self, text: str | None = None) -> dict[str, Any]:
@@ -495,15 +445,13 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         if not game.get("spelling_mode"):
             return {
                 "success": False,
-                "message": "Not in spelling mode.",
-                "game_state": None
+                "message": "Not in spelling mode."
             }
 
         # Get the spelled word from buffer
@@ -523,7 +471,8 @@ class PuzzleGameCoordinator:
 
         spelled_word = "".join(buffer)
 
-        # Clear spelling mode
+        # Clear spelling mode. Save right away: submit_answer returns early
+        # without writing when the game is no longer active.
         game["spelling_mode"] = False
         game["spelling_buffer"] = []
         await self.storage.update_game(game["id"], {
@@ -536,18 +485,14 @@ class PuzzleGameCoordinator:
             game["last_message"] = message
             await self.storage.update_game(game["id"], {"last_message": message})
 
-            state_data = self.game_manager.get_game_state_dict(game)
+            state_data = self._build_state_data(game)
             state_data["spelling_mode"] = False
             state_data["spelling_buffer"] = []
-            state_data["session_active"] = self._session_active
-            state_data["active_satellite"] = self._active_satellite
-            state_data["view_assist_device"] = self._view_assist_device
             self._update_sensor(state_data)
 
             return {
                 "success": False,
-                "message": message,
-                "game_state": state_data
+                "message": message
             }
 
         # Submit the spelled word as an answer
@@ -559,8 +504,7 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         game["spelling_mode"] = False
@@ -574,19 +518,14 @@ class PuzzleGameCoordinator:
             "last_message": message
         })
 
-        state_data = self.game_manager.get_game_state_dict(game)
+        state_data = self._build_state_data(game)
         state_data["spelling_mode"] = False
         state_data["spelling_buffer"] = []
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": message,
-            "game_state": state_data
+            "message": message
         }
 
     async def give_up(self) -> dict[str, Any]:
@@ -595,8 +534,7 @@ class PuzzleGameCoordinator:
         if not game:
             return {
                 "success": False,
-                "message": "No active game.",
-                "game_state": None
+                "message": "No active game."
             }
 
         result = await self.game_manager.give_up(game)
@@ -604,18 +542,12 @@ class PuzzleGameCoordinator:
         game["last_message"] = result["message"]
         await self.storage.update_game(game["id"], {"last_message": result["message"]})
 
-        game = self.storage.get_game(game["id"])
-        state_data = self.game_manager.get_game_state_dict(game)
-        # Preserve session state
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         self._update_sensor(state_data)
 
         return {
             "success": True,
-            "message": result["message"],
-            "game_state": state_data
+            "message": result["message"]
         }
 
     async def handle_listening_timeout(self) -> dict[str, Any]:
@@ -646,7 +578,9 @@ class PuzzleGameCoordinator:
         # Get and increment retry counter
         retry_count = game.get("timeout_retries", 0) + 1
         game["timeout_retries"] = retry_count
-        await self.storage.update_game(game["id"], {"timeout_retries": retry_count})
+        await self.storage.update_game(
+            game["id"], {"timeout_retries": retry_count}, save=False
+        )
 
         max_retries = 3
 
@@ -664,10 +598,7 @@ class PuzzleGameCoordinator:
         game["last_message"] = message
         await self.storage.update_game(game["id"], {"last_message": message})
 
-        state_data = self.game_manager.get_game_state_dict(game)
-        state_data["session_active"] = self._session_active
-        state_data["active_satellite"] = self._active_satellite
-        state_data["view_assist_device"] = self._view_assist_device
+        state_data = self._build_state_data(game)
         state_data["timeout_retries"] = retry_count
         self._update_sensor(state_data)
 
@@ -681,10 +612,12 @@ class PuzzleGameCoordinator:
             "retry_count": retry_count
         }
 
-    async def reset_timeout_retries(self) -> None:
+    async def reset_timeout_retries(self) -> dict[str, Any]:
         """Reset the timeout retry counter (called when user successfully speaks)."""
         game = self.storage.get_current_game()
         if game and game.get("timeout_retries", 0) > 0:
             game["timeout_retries"] = 0
-            await self.storage.update_game(game["id"], {"timeout_retries": 0})
+            await self.storage.update_game(game["id"], {"timeout_retries": 0}, save=False)
+            self.storage.async_delay_save()
             _LOGGER.debug("Reset timeout retry counter")
+        return {"success": True}
@@ -4,41 +4,140 @@ from __future__ import annotations
 import logging
 import random
 from datetime import datetime
-from typing import Any
-
-from .const import POINTS_PER_WORD, FINAL_ANSWER_BONUS, MAX_SCORE
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from .const import (
+    POINTS_PER_WORD,
+    FINAL_ANSWER_BONUS,
+    MAX_SCORE,
+    SENTENCE_ENDINGS,
+    WORDS_PER_PUZZLE,
+)
 from .storage import PuzzleGameStorage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Phase 1 response templates
+_WRONG_ANSWER_MESSAGE = "Wrong, try again. {description}."
+_CORRECT_NEXT_CLUE_MESSAGE = "Correct, {answer}! Score: {score}. Next clue: {clue}."
+_SKIPPED_MESSAGE = "Skipped. Next clue: {clue}."
+
+# Ordinal suffixes indexed by the last digit
+_ORDINAL_SUFFIX = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
+
+
+class _WordInfo(NamedTuple):
+    """Length details derived from a puzzle word or theme."""
+
+    word_count: int
+    letter_count: int
+    letter_positions: tuple[int, ...]
+    compact: str
+
+
+class SubmitResult(NamedTuple):
+    """Outcome of an answer submission."""
+
+    correct: bool
+    message: str  # TTS-friendly
+    score_change: int
+    phase_changed: bool
+    game_completed: bool
+
+
+class ActionResult(NamedTuple):
+    """Outcome of a reveal or skip action."""
+
+    success: bool
+    message: str  # TTS-friendly
+
+
+@lru_cache(maxsize=256)
+def _word_info(word: str) -> _WordInfo:
+    """Compute letter counts, non-space positions and spaceless form of a word."""
+    letter_positions = tuple(i for i, char in enumerate(word) if char != ' ')
+    return _WordInfo(
+        len(word.split()),
+        len(letter_positions),
+        letter_positions,
+        word.replace(' ', ''),
+    )
+
+
+@lru_cache(maxsize=64)
+def _ordinal(n: int) -> str:
+    """Convert number to ordinal string (1st, 2nd, 3rd, etc.)."""
+    suffix = 'th' if 10 <= n % 100 <= 20 else _ORDINAL_SUFFIX[n % 10]
+    return f"{n}{suffix}"
+
+
+@lru_cache(maxsize=256)
+def _word_description(word: str) -> str:
+    """Generate description of word length."""
+    info = _word_info(word)
+
+    if info.word_count > 1:
+        return f"{info.word_count} words, {info.letter_count} letters"
+    else:
+        return f"Word has {info.letter_count} letters"
+
+
+@lru_cache(maxsize=64)
+def _theme_summary(theme: str) -> str:
+    """Describe the theme's length for the phase 2 clue."""
+    info = _word_info(theme)
+    plural = "s" if info.word_count != 1 else ""
+    return f"The theme has {info.word_count} word{plural} and {info.letter_count} letters."
+
+
+def _solved_words_list(solved_indices: list[int], words: list[str]) -> list[str]:
+    """Return the solved words in puzzle order."""
+    return [words[i] for i in sorted(solved_indices) if i < len(words)]
+
+
+def _hint_sentence(theme: str, hint_position: int) -> str:
+    """Describe the phase 2 hint letter, counting positions without spaces."""
+    position = hint_position - theme.count(' ', 0, hint_position) + 1
+    return f"The {_ordinal(position)} letter is {theme[hint_position]}."
+
 
 class GameManager:
-    """Manages game state and logic."""
+    """Manages game state and logic.
+
+    Game updates are applied without saving; the coordinator persists
+    them together with the game's last_message in a single write.
+    """
 
     def __init__(self, storage: PuzzleGameStorage) -> None:
         """Initialize game manager."""
         self.storage = storage
 
     @staticmethod
-    def _ordinal(n: int) -> str:
-        """Convert number to ordinal string (1st, 2nd, 3rd, etc.)."""
-        if 10 <= n % 100 <= 20:
-            suffix = 'th'
+    def format_word_clue(puzzle: dict, index: int, fallback: str = "Next clue") -> str:
+        """Return a word's clue followed by its length, without the final period."""
+        clues = puzzle.get("clues", [])
+        if index < len(clues):
+            clue = clues[index]
+            word_desc = _word_description(puzzle.get("words", [])[index])
         else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-        return f"{n}{suffix}"
+            clue = fallback
+            word_desc = ""
+
+        if clue[-1:] in SENTENCE_ENDINGS:
+            return f"{clue} {word_desc}"
+        return f"{clue}. {word_desc}"
 
     @staticmethod
-    def _word_description(word: str) -> str:
-        """Generate description of word length."""
-        words = word.split()
-        word_count = len(words)
-        letter_count = sum(len(w) for w in words)
-
-        if word_count > 1:
-            return f"{word_count} words, {letter_count} letters"
-        else:
-            return f"Word has {letter_count} letters"
+    def _next_open_word_index(game: dict) -> int | None:
+        """Find the next word after the current one that is not solved or skipped."""
+        start = game["current_word_index"]
+        closed = {*game["solved_words"], *game.get("skipped_words", [])}
+        for step in range(1, WORDS_PER_PUZZLE + 1):
+            index = (start + step) % WORDS_PER_PUZZLE
+            if index not in closed:
+                return index
+        return None
 
     def get_current_word_blanks(self, game: dict) -> str:
         """Get word blanks with revealed letters."""
@@ -64,24 +163,20 @@ class GameManager:
                 str(game["current_word_index"]), []
             )
 
-        # Build blanks with revealed letters
-        result = []
-        for i, char in enumerate(word):
-            if char == ' ':
-                if result:
-                    result.pop()
-                result.append('   ')
-            elif i in revealed:
-                result.append(char)
-                result.append(' ')
-            else:
-                result.append("_")
-                result.append(' ')
-
-        if result and result[-1] == ' ':
-            result.pop()
-
-        return ''.join(result)
+        # Build blanks with revealed letters: letters within a word are
+        # separated by one space, words by three
+        revealed = frozenset(revealed)
+        tokens = []
+        offset = 0
+        for token in word.split(' '):
+            if token:
+                tokens.append(' '.join(
+                    char if offset + i in revealed else '_'
+                    for i, char in enumerate(token)
+                ))
+            offset += len(token) + 1
+
+        return '   '.join(tokens)
 
     def check_answer(self, game: dict, answer: str) -> tuple[bool, str]:
         """Check if answer is correct.
@@ -90,8 +185,7 @@ class GameManager:
             (is_correct, correct_answer)
         """
         puzzle = game.get("puzzle", {})
-        answer = answer.upper().strip()
-        answer_normalized = answer.replace(' ', '')
+        answer_normalized = "".join(answer.upper().split())
 
         if game["phase"] == 1:
             words = puzzle.get("words", [])
@@ -99,36 +193,26 @@ class GameManager:
                 correct_answer = words[game["current_word_index"]]
             else:
                 correct_answer = ""
-            correct_normalized = correct_answer.replace(' ', '')
-            return (answer_normalized == correct_normalized, correct_answer)
         else:
             correct_answer = puzzle.get("theme", "")
-            correct_normalized = correct_answer.replace(' ', '')
-            return (answer_normalized == correct_normalized, correct_answer)
-
-    async def submit_answer(self, game: dict, answer: str) -> dict:
-        """Process answer submission.
-
-        Returns dict with:
-            - correct: bool
-            - score_change: int
-            - message: str (TTS-friendly)
-            - phase_changed: bool
-            - game_completed: bool
-        """
+
+        return (answer_normalized == _word_info(correct_answer).compact, correct_answer)
+
+    async def submit_answer(self, game: dict, answer: str) -> SubmitResult:
+        """Process answer submission."""
         puzzle = game.get("puzzle", {})
         is_correct, correct_answer = self.check_answer(game, answer)
 
         if not is_correct:
             if game["phase"] == 1:
-                word_desc = self._word_description(correct_answer)
-                return {
-                    "correct": False,
-                    "message": f"Wrong, try again. {word_desc}.",
-                    "score_change": 0,
-                    "phase_changed": False,
-                    "game_completed": False
-                }
+                word_desc = _word_description(correct_answer)
+                return SubmitResult(
+                    correct=False,
+                    message=_WRONG_ANSWER_MESSAGE.format(description=word_desc),
+                    score_change=0,
+                    phase_changed=False,
+                    game_completed=False
+                )
             else:
                 # Phase 2: Wrong final answer = game over
                 game["is_active"] = False
@@ -139,15 +223,15 @@ class GameManager:
                     "is_active": False,
                     "gave_up": False,
                     "completed_at": game["completed_at"]
-                })
+                }, save=False)
 
-                return {
-                    "correct": False,
-                    "message": f"Wrong! The answer was {correct_answer}. Final score: {game['score']} out of {MAX_SCORE}. Better luck next time!",
-                    "score_change": 0,
-                    "phase_changed": False,
-                    "game_completed": True
-                }
+                return SubmitResult(
+                    correct=False,
+                    message=f"Wrong! The answer was {correct_answer}. Final score: {game['score']} out of {MAX_SCORE}. Better luck next time!",
+                    score_change=0,
+                    phase_changed=False,
+                    game_completed=True
+                )
 
         # Correct answer!
         if game["phase"] == 1:
@@ -155,99 +239,76 @@ class GameManager:
             game["reveals"] += 1
             game["solved_words"].append(game["current_word_index"])
 
+            # Only fields that actually changed are passed to storage
+            updates = {
+                "score": game["score"],
+                "reveals": game["reveals"],
+                "solved_words": game["solved_words"],
+            }
+
             if game["current_word_index"] in game.get("skipped_words", []):
                 game["skipped_words"].remove(game["current_word_index"])
+                updates["skipped_words"] = game["skipped_words"]
 
-            # Check if all 5 words are solved
-            if len(game["solved_words"]) >= 5:
+            # Check if all words are solved
+            if len(game["solved_words"]) >= WORDS_PER_PUZZLE:
                 game["phase"] = 2
                 game["current_word_index"] = 0
 
                 words = puzzle.get("words", [])
-                solved_words_list = [words[i] for i in sorted(game["solved_words"]) if i < len(words)]
-                solved_words_str = ", ".join(solved_words_list)
+                solved_words_str = ", ".join(_solved_words_list(game["solved_words"], words))
 
                 theme = puzzle.get("theme", "")
-                theme_words = theme.split()
-                word_count = len(theme_words)
-                letter_count = sum(len(word) for word in theme_words)
+                letter_positions = _word_info(theme).letter_positions
 
                 # Generate hint for phase 2
-                theme_letters = [(i, c) for i, c in enumerate(theme) if c != ' ']
-                if theme_letters:
-                    hint_index, revealed_letter = random.choice(theme_letters)
+                if letter_positions:
+                    hint_index = random.choice(letter_positions)
                     game["revealed_letters"] = {"phase2_hint_position": hint_index}
-                    position = len([c for c in theme[:hint_index] if c != ' ']) + 1
-                    hint_message = f"The {self._ordinal(position)} letter is {revealed_letter}."
+                    hint_message = _hint_sentence(theme, hint_index)
                 else:
                     game["revealed_letters"] = {}
                     hint_message = ""
 
-                await self.storage.update_game(game["id"], {
-                    "phase": 2,
-                    "current_word_index": 0,
-                    "score": game["score"],
-                    "reveals": game["reveals"],
-                    "solved_words": game["solved_words"],
-                    "skipped_words": game.get("skipped_words", []),
-                    "revealed_letters": game["revealed_letters"]
-                })
-
-                return {
-                    "correct": True,
-                    "message": f"Correct, {correct_answer}! You finished all 5 words. "
-                               f"Now here's the real challenge. These five words are your clues: {solved_words_str}. "
-                               f"The theme has {word_count} word{'s' if word_count != 1 else ''} and {letter_count} letters. "
-                               f"{hint_message}",
-                    "score_change": POINTS_PER_WORD,
-                    "phase_changed": True,
-                    "game_completed": False
-                }
+                updates["phase"] = 2
+                updates["current_word_index"] = 0
+                updates["revealed_letters"] = game["revealed_letters"]
+                await self.storage.update_game(game["id"], updates, save=False)
+
+                return SubmitResult(
+                    correct=True,
+                    message=f"Correct, {correct_answer}! You finished all {WORDS_PER_PUZZLE} words. "
+                            f"Now here's the real challenge. These {WORDS_PER_PUZZLE} words are your clues: {solved_words_str}. "
+                            f"{_theme_summary(theme)} "
+                            f"{hint_message}",
+                    score_change=POINTS_PER_WORD,
+                    phase_changed=True,
+                    game_completed=False
+                )
             else:
                 # More words to solve - find next word
-                start_index = game["current_word_index"]
-                next_index = (start_index + 1) % 5
-                found_next = False
-
-                for _ in range(5):
-                    if (next_index not in game["solved_words"] and
-                        next_index not in game.get("skipped_words", [])):
-                        game["current_word_index"] = next_index
-                        found_next = True
-                        break
-                    next_index = (next_index + 1) % 5
-
-                if not found_next and game.get("skipped_words"):
-                    game["current_word_index"] = game["skipped_words"][0]
-
-                clues = puzzle.get("clues", [])
-                words = puzzle.get("words", [])
-                if game["current_word_index"] < len(clues):
-                    next_clue = clues[game["current_word_index"]]
-                    next_word_desc = self._word_description(words[game["current_word_index"]])
-                else:
-                    next_clue = "Next clue"
-                    next_word_desc = ""
-
-                if not next_clue.endswith(('.', '!', '?')):
-                    next_clue = f"{next_clue}."
-
-                await self.storage.update_game(game["id"], {
-                    "current_word_index": game["current_word_index"],
-                    "score": game["score"],
-                    "reveals": game["reveals"],
-                    "solved_words": game["solved_words"],
-                    "skipped_words": game.get("skipped_words", [])
-                })
-
-                return {
-                    "correct": True,
-                    "message": f"Correct, {correct_answer}! Score: {game['score']}. "
-                               f"Next clue: {next_clue} {next_word_desc}.",
-                    "score_change": POINTS_PER_WORD,
-                    "phase_changed": False,
-                    "game_completed": False
-                }
+                next_index = self._next_open_word_index(game)
+                if next_index is None and game.get("skipped_words"):
+                    next_index = game["skipped_words"][0]
+                if next_index is not None and next_index != game["current_word_index"]:
+                    game["current_word_index"] = next_index
+                    updates["current_word_index"] = next_index
+
+                next_clue = self.format_word_clue(puzzle, game["current_word_index"])
+
+                await self.storage.update_game(game["id"], updates, save=False)
+
+                return SubmitResult(
+                    correct=True,
+                    message=_CORRECT_NEXT_CLUE_MESSAGE.format(
+                        answer=correct_answer,
+                        score=game["score"],
+                        clue=next_clue,
+                    ),
+                    score_change=POINTS_PER_WORD,
+                    phase_changed=False,
+                    game_completed=False
+                )
         else:
             # Phase 2: Correct final answer!
             game["score"] += FINAL_ANSWER_BONUS
@@ -258,31 +319,29 @@ class GameManager:
                 "score": game["score"],
                 "is_active": False,
                 "completed_at": game["completed_at"]
-            })
-
-            perfect = game["score"] == MAX_SCORE
-            message = f"Correct, {correct_answer}! Final score: {game['score']} out of {MAX_SCORE}."
-            if perfect:
-                message += " Perfect game!"
-            message += " You've completed the puzzle! Say 'play bonus game' to play another round."
-
-            return {
-                "correct": True,
-                "message": message,
-                "score_change": FINAL_ANSWER_BONUS,
-                "phase_changed": False,
-                "game_completed": True
-            }
+            }, save=False)
+
+            perfect = " Perfect game!" if game["score"] == MAX_SCORE else ""
+            message = (f"Correct, {correct_answer}! Final score: {game['score']} out of {MAX_SCORE}."
+                       f"{perfect} You've completed the puzzle! Say 'play bonus game' to play another round.")
+
+            return SubmitResult(
+                correct=True,
+                message=message,
+                score_change=FINAL_ANSWER_BONUS,
+                phase_changed=False,
+                game_completed=True
+            )
 
-    async def reveal_letter(self, game: dict) -> dict:
+    async def reveal_letter(self, game: dict) -> ActionResult:
         """Reveal a random letter."""
         puzzle = game.get("puzzle", {})
 
         if game["reveals"] <= 0:
-            return {
-                "success": False,
-                "message": "No reveals left. Earn more by solving words correctly."
-            }
+            return ActionResult(
+                success=False,
+                message="No reveals left. Earn more by solving words correctly."
+            )
 
         if game["phase"] == 1:
             words = puzzle.get("words", [])
@@ -298,58 +357,56 @@ class GameManager:
             # Phase 2: Only allow ONE manual reveal
             final_revealed = game.get("revealed_letters", {}).get("final", [])
             if final_revealed:
-                return {
-                    "success": False,
-                    "message": "No reveals allowed on the final word."
-                }
+                return ActionResult(
+                    success=False,
+                    message="No reveals allowed on the final word."
+                )
 
-        revealed = list(game.get("revealed_letters", {}).get(key, []))
+        revealed_letters = game.setdefault("revealed_letters", {})
+        key_revealed = set(revealed_letters.get(key, []))
 
         # For Phase 2, exclude hint position
+        excluded = key_revealed
         if game["phase"] == 2:
-            hint_position = game.get("revealed_letters", {}).get("phase2_hint_position")
-            if hint_position is not None and hint_position not in revealed:
-                revealed.append(hint_position)
+            hint_position = revealed_letters.get("phase2_hint_position")
+            if hint_position is not None:
+                excluded = key_revealed | {hint_position}
 
-        unrevealed = [i for i in range(len(word)) if i not in revealed and word[i] != ' ']
+        unrevealed = [i for i in _word_info(word).letter_positions if i not in excluded]
 
         if not unrevealed:
-            return {
-                "success": False,
-                "message": "All letters already revealed."
-            }
+            return ActionResult(
+                success=False,
+                message="All letters already revealed."
+            )
 
         pos = random.choice(unrevealed)
 
-        if "revealed_letters" not in game:
-            game["revealed_letters"] = {}
-
-        final_revealed = list(game.get("revealed_letters", {}).get(key, []))
-        final_revealed.append(pos)
-        game["revealed_letters"][key] = final_revealed
+        key_revealed.add(pos)
+        revealed_letters[key] = sorted(key_revealed)
         game["reveals"] -= 1
 
         await self.storage.update_game(game["id"], {
             "revealed_letters": game["revealed_letters"],
             "reveals": game["reveals"]
-        })
+        }, save=False)
 
         blanks = self.get_current_word_blanks(game)
 
-        return {
-            "success": True,
-            "message": f"Here's a letter: {blanks}. {game['reveals']} reveals left."
-        }
+        return ActionResult(
+            success=True,
+            message=f"Here's a letter: {blanks}. {game['reveals']} reveals left."
+        )
 
-    async def skip_word(self, game: dict) -> dict:
+    async def skip_word(self, game: dict) -> ActionResult:
         """Skip current word (Phase 1 only)."""
         puzzle = game.get("puzzle", {})
 
         if game["phase"] != 1:
-            return {
-                "success": False,
-                "message": "Can't skip during final answer phase."
-            }
+            return ActionResult(
+                success=False,
+                message="Can't skip during final answer phase."
+            )
 
         if "skipped_words" not in game:
             game["skipped_words"] = []
@@ -359,47 +416,28 @@ class GameManager:
 
         # Find next word - first try unskipped words, then cycle through skipped
         start_index = game["current_word_index"]
-        next_index = (start_index + 1) % 5
-        found_next = False
-
-        # First pass: look for words that haven't been skipped or solved
-        for _ in range(5):
-            if (next_index not in game["solved_words"] and
-                next_index not in game["skipped_words"]):
-                game["current_word_index"] = next_index
-                found_next = True
-                break
-            next_index = (next_index + 1) % 5
-
-        # Second pass: if all remaining words are skipped, cycle through them
-        if not found_next and game["skipped_words"]:
+        next_index = self._next_open_word_index(game)
+
+        if next_index is not None:
+            game["current_word_index"] = next_index
+        elif game["skipped_words"]:
+            # All remaining words are skipped, cycle through them
             # Find the next skipped word after current position
             current_pos = game["skipped_words"].index(start_index) if start_index in game["skipped_words"] else -1
             next_pos = (current_pos + 1) % len(game["skipped_words"])
             game["current_word_index"] = game["skipped_words"][next_pos]
 
-        clues = puzzle.get("clues", [])
-        words = puzzle.get("words", [])
-        if game["current_word_index"] < len(clues):
-            next_clue = clues[game["current_word_index"]]
-            next_word_desc = self._word_description(words[game["current_word_index"]])
-        else:
-            next_clue = "Next clue"
-            next_word_desc = ""
-
-        if not next_clue.endswith(('.', '!', '?')):
-            next_clue = f"{next_clue}."
+        next_clue = self.format_word_clue(puzzle, game["current_word_index"])
 
         await self.storage.update_game(game["id"], {
             "current_word_index": game["current_word_index"],
             "skipped_words": game["skipped_words"]
-        })
+        }, save=False)
 
-        return {
-            "success": True,
-            "message": f"Skipped. Next clue: {next_clue} {next_word_desc}.",
-            "phase_changed": False
-        }
+        return ActionResult(
+            success=True,
+            message=_SKIPPED_MESSAGE.format(clue=next_clue)
+        )
 
     async def give_up(self, game: dict) -> dict:
         """End game and reveal all answers."""
@@ -413,7 +451,7 @@ class GameManager:
             "is_active": False,
             "gave_up": True,
             "completed_at": game["completed_at"]
-        })
+        }, save=False)
 
         words = puzzle.get("words", [])
         theme = puzzle.get("theme", "")
@@ -430,37 +468,24 @@ class GameManager:
     def get_current_clue(self, game: dict) -> str:
         """Get the current clue text for TTS."""
         puzzle = game.get("puzzle", {})
-        clues = puzzle.get("clues", [])
         words = puzzle.get("words", [])
         theme = puzzle.get("theme", "")
 
         if game["phase"] == 1:
-            if game["current_word_index"] < len(clues):
-                clue = clues[game["current_word_index"]]
-                word_desc = self._word_description(words[game["current_word_index"]])
-                if not clue.endswith(('.', '!', '?')):
-                    clue = f"{clue}."
-                return f"{clue} {word_desc}."
+            if game["current_word_index"] < len(puzzle.get("clues", [])):
+                return f"{self.format_word_clue(puzzle, game['current_word_index'])}."
             return "No clue available"
         else:
             # Phase 2 - show solved words as reminder
-            solved_words_list = [words[i] for i in sorted(game["solved_words"]) if i < len(words)]
+            solved_words_list = _solved_words_list(game["solved_words"], words)
             solved_words_str = ", ".join(solved_words_list) if solved_words_list else "none"
 
-            theme_words = theme.split()
-            word_count = len(theme_words)
-            letter_count = sum(len(word) for word in theme_words)
-
             hint_position = game.get("revealed_letters", {}).get("phase2_hint_position")
             if hint_position is not None and hint_position < len(theme):
-                revealed_letter = theme[hint_position]
-                position = len([c for c in theme[:hint_position] if c != ' ']) + 1
-                return (f"Your clues are: {solved_words_str}. The theme has {word_count} "
-                        f"word{'s' if word_count != 1 else ''} and {letter_count} letters. "
-                        f"The {self._ordinal(position)} letter is {revealed_letter}.")
+                return (f"Your clues are: {solved_words_str}. {_theme_summary(theme)} "
+                        f"{_hint_sentence(theme, hint_position)}")
             else:
-                return (f"Your clues are: {solved_words_str}. The theme has {word_count} "
-                        f"word{'s' if word_count != 1 else ''} and {letter_count} letters.")
+                return f"Your clues are: {solved_words_str}. {_theme_summary(theme)}"
 
     def get_game_state_dict(self, game: dict) -> dict:
         """Convert game to state dictionary for sensor."""
@@ -468,18 +493,19 @@ class GameManager:
         words = puzzle.get("words", [])
         theme = puzzle.get("theme", "")
 
-        solved_words_list = [words[i] for i in sorted(game.get("solved_words", [])) if i < len(words)]
+        solved = game.get("solved_words", [])
+        solved_words_list = _solved_words_list(solved, words)
 
         return {
             "game_id": game.get("id", ""),
             "phase": game.get("phase", 1),
-            "word_number": game.get("current_word_index", 0) + 1 if game.get("phase") == 1 else 6,
+            "word_number": game.get("current_word_index", 0) + 1 if game.get("phase") == 1 else WORDS_PER_PUZZLE + 1,
             "score": game.get("score", 0),
             "reveals": game.get("reveals", 0),
             "blanks": self.get_current_word_blanks(game),
             "clue": self.get_current_clue(game),
             "solved_words": solved_words_list,
-            "solved_word_indices": list(game.get("solved_words", [])),
+            "solved_word_indices": list(solved),
             "is_active": game.get("is_active", False),
             "last_message": game.get("last_message"),
             "theme_revealed": theme if not game.get("is_active") else None,
@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import logging
 from typing import Any
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
-from .const import STORAGE_KEY, STORAGE_VERSION
+from .const import STORAGE_KEY, STORAGE_SAVE_DELAY, STORAGE_VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,13 +39,38 @@ class PuzzleGameStorage:
         """Save data to storage."""
         await self._store.async_save(self._data)
 
+    @callback
+    def async_delay_save(self) -> None:
+        """Schedule a save for changes that can wait a few seconds.
+
+        Repeated calls within the delay are written to disk once. Any
+        async_save in the meantime writes them immediately.
+        """
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
+
+    @property
+    def legacy_files_cleaned(self) -> bool:
+        """Return whether www files left by old versions are known to be gone."""
+        return self._data.get("legacy_www_cleaned", False)
+
+    @callback
+    def async_set_legacy_files_cleaned(self) -> None:
+        """Remember that www files left by old versions no longer need removing."""
+        self._data["legacy_www_cleaned"] = True
+        self.async_delay_save()
+
     # Puzzle methods
     def get_daily_puzzle(self, date: str) -> dict | None:
         """Get puzzle for a specific date."""
         return self._data.get("puzzles", {}).get(date)
 
-    async def save_puzzle(self, date: str, puzzle: dict, is_daily: bool = True) -> None:
-        """Save a puzzle."""
+    async def save_puzzle(
+        self, date: str, puzzle: dict, is_daily: bool = True, save: bool = True
+    ) -> None:
+        """Save a puzzle.
+
+        Pass save=False when the caller persists again right afterwards.
+        """
         if "puzzles" not in self._data:
             self._data["puzzles"] = {}
 
@@ -55,7 +80,8 @@ class PuzzleGameStorage:
             "created_at": datetime.utcnow().isoformat(),
         }
         self._data["puzzles"][date] = puzzle_data
-        await self.async_save()
+        if save:
+            await self.async_save()
 
     # Game methods
     def get_game(self, game_id: str) -> dict | None:
@@ -73,12 +99,17 @@ class PuzzleGameStorage:
             return self.get_game(game_id)
         return None
 
-    async def create_game(self, puzzle_date: str, puzzle: dict, is_bonus: bool = False) -> dict:
-        """Create a new game."""
+    async def create_game(
+        self, puzzle_date: str, puzzle: dict, is_bonus: bool = False, save: bool = True
+    ) -> dict:
+        """Create a new game.
+
+        Pass save=False when the caller persists again right afterwards.
+        """
         if "games" not in self._data:
             self._data["games"] = {}
 
-        game_id = str(uuid.uuid4())
+        game_id = uuid.uuid4().hex
         game = {
             "id": game_id,
             "puzzle_date": puzzle_date,
@@ -100,17 +131,23 @@ class PuzzleGameStorage:
 
         self._data["games"][game_id] = game
         self._data["current_game_id"] = game_id
-        await self.async_save()
+        if save:
+            await self.async_save()
 
         return game
 
-    async def update_game(self, game_id: str, updates: dict) -> dict | None:
-        """Update a game."""
+    async def update_game(self, game_id: str, updates: dict, save: bool = True) -> dict | None:
+        """Update a game.
+
+        Pass save=False to apply the updates in memory only and let a
+        following update_game call write them to disk together.
+        """
         if game_id not in self._data.get("games", {}):
             return None
 
         self._data["games"][game_id].update(updates)
-        await self.async_save()
+        if save:
+            await self.async_save()
 
         return self._data["games"][game_id]
 
@@ -119,24 +156,24 @@ class PuzzleGameStorage:
         self._data["current_game_id"] = game_id
         await self.async_save()
 
-    def get_active_daily_game(self, date: str) -> dict | None:
-        """Get active game for today's daily puzzle."""
-        for game_id, game in self._data.get("games", {}).items():
-            if (game.get("puzzle_date") == date and
-                game.get("is_active") and
-                not game.get("is_bonus")):
-                return game
-        return None
-
-    def get_completed_daily_game(self, date: str) -> dict | None:
-        """Get completed game for today's daily puzzle."""
-        for game_id, game in self._data.get("games", {}).items():
-            if (game.get("puzzle_date") == date and
-                not game.get("is_active") and
-                not game.get("is_bonus") and
-                game.get("completed_at")):
-                return game
-        return None
+    def get_daily_games(self, date: str) -> tuple[dict | None, dict | None]:
+        """Get the active and the completed game for a daily puzzle.
+
+        Both are found in a single pass over the stored games.
+        """
+        active = None
+        completed = None
+        for game in self._data.get("games", {}).values():
+            if game.get("puzzle_date") != date or game.get("is_bonus"):
+                continue
+            if game.get("is_active"):
+                if active is None:
+                    active = game
+            elif game.get("completed_at") and completed is None:
+                completed = game
+            if active is not None and completed is not None:
+                break
+        return active, completed
 
     def get_active_bonus_game(self) -> dict | None:
         """Get any active bonus game."""
@@ -147,8 +184,6 @@ class PuzzleGameStorage:
 
     async def cleanup_old_games(self, days_to_keep: int = 7) -> None:
         """Remove games older than specified days."""
-        from datetime import timedelta
-
         cutoff = datetime.utcnow() - timedelta(days=days_to_keep)
         games_to_remove = []
 